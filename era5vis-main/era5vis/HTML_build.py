@@ -1,16 +1,13 @@
 
 import os
+from pathlib import Path
 
-def build_html(plot1, plot2, date):
+def build_html(plot1, plot2, plot3, date):
     outdir = "html"
 
     fname = f"ERA5_mean_anomaly_and_sounding_{date}.html"
 
-    if not os.path.isdir(outdir):
-        os.makedirs(outdir)
-        print(f"Created output directory: {outdir}")
-    else:
-        print(f"Output directory already exists: {outdir}")
+    Path(outdir).mkdir(parents=True, exist_ok=True)
 
     outpath = os.path.join(outdir, fname)
 
@@ -26,6 +23,7 @@ def build_html(plot1, plot2, date):
         }}
         .container {{
             display: flex;
+            flex-wrap: wrap;
             gap: 20px;
             justify-content: center;
             align-items: flex-start;
@@ -41,6 +39,7 @@ def build_html(plot1, plot2, date):
     <div class="container">
         <img src="../PNG/{plot1}" alt="Plot 1">
         <img src="../PNG/{plot2}" alt="Plot 2">
+        <img src="../PNG/{plot3}" alt="Plot 3">
     </div>
 
 </body>
@@ -1,3 +1,4 @@
+import functools
 import matplotlib.pyplot as plt  
 import numpy as np  
 import os
@@ -9,32 +10,105 @@ import cartopy.crs as ccrs
 import cartopy.feature as cfeature
 from cartopy.mpl.gridliner import LONGITUDE_FORMATTER, LATITUDE_FORMATTER
 
+from era5vis import cfg, era5
+
 #FIXED VARIABLES
+G = 9.81
+# converts geopotential (m2 s-2) to geopotential height in dam
+INV_G10 = 1.0 / (G * 10)
+
+
+@functools.lru_cache(maxsize=4)
+def _open_clim(path):
+    # the climatology does not change, so keep it open across calls
+    return era5.open_dataset(path)
+
+
+def _coarsen(da, factor):
+    # block-average the field for plotting, the map looks the same but
+    # there are factor**2 fewer cells to draw and contour; rows and columns
+    # that do not fill a whole block at the end of the grid are dropped
+    if factor <= 1:
+        return da
+    return da.coarsen(latitude=factor, longitude=factor, boundary='trim').mean()
+
+
+def _same_grid(a, b):
+    # true when both fields are on the same latitude/longitude grid
+    return all(np.array_equal(a[c].values, b[c].values) for c in ('latitude', 'longitude'))
+
+
+def _anomaly(var, clim):
+    # var minus clim, aligned by xarray only if the grids differ
+    if _same_grid(var, clim):
+        # ERA5 and climatology share the grid, skip xarray's index alignment
+        return var.copy(data=var.data - clim.data)
+    return var - clim
+
+
+def Plot_map_anomaly(pathfile,param,pressure_level,lat_pt,lon_pt,coarsen_factor=2,show=False,dpi=120):
+    """Plot the anomaly of param against the model climatology on a map.
 
+    Parameters
+    ----------
+    pathfile : str or pathlib.Path
+        ERA5 NetCDF file or Zarr store
+    param : str
+        ERA5 variable
+    pressure_level : int
+        pressure level (hPa)
+    lat_pt, lon_pt : float
+        location marked on the map
+    coarsen_factor : int
+        the anomaly and geopotential are block-averaged over
+        coarsen_factor x coarsen_factor cells before plotting. With the
+        default of 2 the map is drawn at half the ERA5 resolution (0.5°
+        instead of 0.25°), use 1 to plot the full resolution
+    show : bool
+        show the figure after saving
+    dpi : int
+        resolution of the saved figure
 
-def Plot_map_anomaly(pathfile,param,pressure_level,lat_pt,lon_pt):
+    Returns
+    -------
+    fname : str
+        name of the file written to the PNG directory
+    """
     range = [-55,35,35,90]
-    DATA_DIR = Path(__file__).parent / "data"
-    clim_path = DATA_DIR / "model_clim.nc"
-    clim_monthly = xr.open_dataset(clim_path)
+    clim_path = cfg.clim_file_chunked
+    if not clim_path.exists():
+        clim_path = cfg.clim_file
+    # open lazily, only the selected slab is read from disk
+    clim_monthly = _open_clim(str(clim_path))
 
-    ds = xr.open_dataset(pathfile)
+    ds = era5.open_dataset(pathfile)
     #Get the parameter and Month information
     long_name = ds[param].attrs.get("long_name", param)
     units = ds[param].attrs.get("units", "")
     month = ds.valid_time.dt.month.item()
     date=ds.valid_time.dt.strftime("%B %Y").item()
-    #Calculate anomaly
-    anomaly = ds - clim_monthly.sel(month=month)
+    #Calculate anomaly only for param on the selected level and time step
+    # select the level once for the field and the z contours
+    sub = ds[[param, 'z']].sel(pressure_level=pressure_level).isel(valid_time=0)
+    var = era5.decode_variable(sub[param])
+    clim = era5.decode_variable(clim_monthly[param].sel(month=month, pressure_level=pressure_level))
+    anom = _anomaly(var, clim)
+    # z auf dem gleichen Level und Zeitschritt, read with the anomaly in one pass
+    z_level = era5.decode_variable(sub['z'])
+    fields = _coarsen(xr.Dataset({'anom': anom, 'z': z_level}), coarsen_factor).load()
+    anom2d = fields['anom']
     #Create Map
     fig = plt.figure(figsize=(12,6))
     ax = plt.axes(projection=ccrs.PlateCarree())
     ax.set_extent(range)  
     ax.coastlines()
-    #Create the contour plot include some map features
-    lon = anomaly['longitude']
-    lat = anomaly['latitude']
-    im = ax.contourf(lon,lat,anomaly[param].sel(pressure_level=pressure_level).isel(valid_time=0),transform=ccrs.PlateCarree())
+    #Create the anomaly plot include some map features
+    lon = anom2d['longitude']
+    lat = anom2d['latitude']
+    # pcolormesh instead of contourf: no contour polygons to trace, and the
+    # extent is already set so cartopy skips autoscaling.
+    # rasterize the field, the z contour lines below stay vectorized
+    im = ax.pcolormesh(lon,lat,anom2d,shading='auto',transform=ccrs.PlateCarree(),rasterized=True)
     cbar = plt.colorbar(im, ax=ax, orientation='vertical', pad=0.05)
     cbar.set_label(f"{long_name} [{units}]", fontsize=12)
     gl = ax.gridlines(draw_labels=True, crs=ccrs.PlateCarree(),
@@ -51,10 +125,7 @@ def Plot_map_anomaly(pathfile,param,pressure_level,lat_pt,lon_pt):
     ax.axhline(lat_pt, color='red', linestyle='-', linewidth=1)
     ax.axvline(lon_pt, color='red', linestyle='-', linewidth=1)
     
-    # z auf dem gleichen Level und Zeitschritt
-    z_level = ds['z'].sel(pressure_level=pressure_level).isel(valid_time=0)
-    g=9.81
-    z_dam = z_level / (g * 10)
+    z_dam = fields['z'].data * INV_G10
     # Konturen
     cs = ax.contour(lon, lat, z_dam, colors='black', linewidths=1, transform=ccrs.PlateCarree())
 
@@ -67,19 +138,18 @@ def Plot_map_anomaly(pathfile,param,pressure_level,lat_pt,lon_pt):
     fname = (
     f"ERA5_{param}_"
     f"{pressure_level}hPa_"
-    f"{date}.png"
+    f"{date}.webp"
     )
     
     outdir = "PNG"
 
-    if not os.path.isdir(outdir):
-        os.makedirs(outdir)
-        print(f"Created output directory: {outdir}")
-    else:
-        print(f"Output directory already exists: {outdir}")
+    Path(outdir).mkdir(parents=True, exist_ok=True)
     outpath = os.path.join(outdir, fname)
-    plt.savefig(outpath, dpi=300, bbox_inches="tight")
+    # the html page shows the plots at reduced size, so a lower dpi is enough
+    plt.savefig(outpath, dpi=dpi, bbox_inches="tight")
     print(f"Plot saved to: {outpath}")
-    plt.show()
+    if show:
+        plt.show()
+    plt.close(fig)
     return fname
 
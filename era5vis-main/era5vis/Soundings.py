@@ -1,8 +1,8 @@
 import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
-import xarray as xr
 import os
+from pathlib import Path
 from datetime import datetime
 import cartopy.crs as ccrs
 import cartopy.feature as cfeature
@@ -10,28 +10,48 @@ import matplotlib.ticker as mticker
 from metpy.plots import SkewT
 from metpy.units import pandas_dataframe_to_unit_arrays, units
 import metpy.calc as mpcalc
+import metpy.constants as mpconsts
 from metpy.calc import potential_temperature
 from metpy.calc import precipitable_water
 
-def plot_sounding(pathfile, lat_pt, lon_pt):
-    ds = xr.open_dataset(pathfile)
-    ds = ds.metpy.parse_cf()
+from era5vis import era5
+
+# reference grids of the special lines, the same for every sounding
+_DRY_T0 = np.arange(233, 533, 10) * units.K
+_MOIST_T0 = np.arange(233, 400, 5) * units.K
+_MIX_P = np.arange(1000, 99, -20) * units.hPa
+# pressure axis of the adiabats, matches the default SkewT y-limits
+_ADIABAT_P = np.linspace(1050, 100) * units.hPa
+
+
+def _td_from_q(p_pa, q):
+    # dewpoint in K from pressure in Pa and specific humidity in kg/kg, the
+    # same formula as mpcalc.dewpoint_from_specific_humidity on plain floats
+    e = p_pa * q / (mpconsts.nounit.epsilon * (1 - q) + q)
+    ln = np.log(e / mpconsts.nounit.sat_pressure_0c)
+    return mpconsts.nounit.zero_degc + 243.5 * ln / (17.67 - ln)
+
+
+def plot_sounding(pathfile, lat_pt, lon_pt, show=False, dpi=120):
+    # open lazily, only the selected column is read from disk
+    ds = era5.open_dataset(pathfile)
     date=ds.valid_time.dt.strftime("%B %Y").item()
     ds = ds.squeeze()
     profile = ds.sel(
         latitude=lat_pt,
         longitude=lon_pt,
         method="nearest"
-    )
+    ).load()
 
 
-    p = profile['pressure_level'].metpy.unit_array
-    T = profile['t'].metpy.unit_array
-    q = profile['q'].metpy.unit_array
-    u = profile['u'].metpy.unit_array
-    v = profile['v'].metpy.unit_array
+    # plain arrays with the ERA5 units attached, cheaper than the metpy accessor
+    p = profile['pressure_level'].values * units.hPa
+    T = era5.decode_variable(profile['t']).values * units.K
+    q = era5.decode_variable(profile['q']).values * units('kg/kg')
+    u = era5.decode_variable(profile['u']).values * units('m/s')
+    v = era5.decode_variable(profile['v']).values * units('m/s')
     #Calculate dew point temperature from specific humidity
-    Td = mpcalc.dewpoint_from_specific_humidity(p, T, q)
+    Td = _td_from_q(p.m_as('Pa'), q.m_as('kg/kg')) * units.K
 
     # Change default to be better for skew-T (optional)
     fig = plt.figure(figsize=(9, 9))
@@ -46,11 +66,12 @@ def plot_sounding(pathfile, lat_pt, lon_pt):
     skew.plot_barbs(p, u, v, y_clip_radius=0.03)
     #skew.plot_barbs(p[::3], u[::3], v[::3], y_clip_radius=0.03)
     # Add the relevant special lines to plot throughout the figure
-    skew.plot_dry_adiabats(t0=np.arange(233, 533, 10) * units.K,
+    skew.plot_dry_adiabats(t0=_DRY_T0, pressure=_ADIABAT_P,
                         alpha=0.25, color='orangered')
-    skew.plot_moist_adiabats(t0=np.arange(233, 400, 5) * units.K,
-                            alpha=0.25, color='tab:green')
-    skew.plot_mixing_lines(pressure=np.arange(1000, 99, -20) * units.hPa,
+    # metpy sets colors='b' by default, which would override color=
+    skew.plot_moist_adiabats(t0=_MOIST_T0, pressure=_ADIABAT_P,
+                            alpha=0.25, colors='tab:green')
+    skew.plot_mixing_lines(pressure=_MIX_P,
                         linestyle='dotted', color='tab:blue')
     #skew.shade_cape(pressure=p,t=T,t_parcel=)
     # Add some descriptive titles
@@ -58,19 +79,18 @@ def plot_sounding(pathfile, lat_pt, lon_pt):
     fname = (
     f"ERA5_sounding_"
     f"{lon_pt},{lat_pt}"
-    f"{date}.png"
+    f"{date}.webp"
     )
     
     outdir = "PNG"
 
-    if not os.path.isdir(outdir):
-        os.makedirs(outdir)
-        print(f"Created output directory: {outdir}")
-    else:
-        print(f"Output directory already exists: {outdir}")
+    Path(outdir).mkdir(parents=True, exist_ok=True)
     outpath = os.path.join(outdir, fname)
-    plt.savefig(outpath, dpi=300, bbox_inches="tight")
+    # the html page shows the plots at reduced size, so a lower dpi is enough
+    plt.savefig(outpath, dpi=dpi, bbox_inches="tight")
     print(f"Plot saved to: {outpath}")
-    plt.show()
+    if show:
+        plt.show()
+    plt.close(fig)
     return fname
     
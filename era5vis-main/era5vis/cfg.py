@@ -1,11 +1,26 @@
 """ Configuration module containing settings and constants. """
 
+import os
+from importlib.resources import files
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
-datafile = BASE_DIR / "era5_example_dataset.nc"
+# example dataset: shipped package data first, then the ERA5VIS_DATA
+# environment variable, then the copy at the top of the repository
+datafile = Path(str(files('era5vis').joinpath('data/era5_example_dataset.nc')))
+if not datafile.exists():
+    datafile = Path(os.environ.get('ERA5VIS_DATA', BASE_DIR / "era5_example_dataset.nc"))
 #datafile = r"C:\Users\User\Documents\Master\Scientific programming\Project\scipro_JaSoKi\era5_example_dataset.nc"
 # location of data directory containing html template
 pkgdir = Path(__file__).parents[0]
 html_template = Path(pkgdir) / 'data' / 'template.html'
+# model climatology for the anomaly map, the chunked copy is written by
+# era5vis.rechunk and preferred when present
+clim_file = Path(pkgdir) / 'data' / 'model_clim.nc'
+clim_file_chunked = Path(pkgdir) / 'data' / 'model_clim_chunked.nc'
+
+# dask chunks used when opening ERA5 NetCDF files lazily: an empty dict keeps
+# the on-disk chunks, so multi-time or multi-month files are never split
+# inside a stored chunk; select time and level before loading instead
+era5_chunks = {}
 #Pressure level 3 hPa not found in dataset. Available levels: [925. 850. 700. 500. 300.]
\ No newline at end of file
@@ -6,10 +6,52 @@ November 2025
 Modified by Kilian Trummer Jannuary 2026
 """
 
+import argparse
 import sys
 import webbrowser
+from concurrent.futures import ProcessPoolExecutor
 import era5vis
 
+
+class _ArgumentError(Exception):
+    """Raised by _Parser instead of printing usage and exiting."""
+
+
+class _Parser(argparse.ArgumentParser):
+    """ArgumentParser that leaves reporting errors to the tools."""
+
+    def error(self, message):
+        raise _ArgumentError(message)
+
+
+def _make_parser(prog):
+    """ArgumentParser with the options shared by all era5vis tools.
+
+    The built-in help is switched off, the tools print their own HELP text.
+    """
+    parser = _Parser(prog=prog, add_help=False, allow_abbrev=False)
+    parser.add_argument('-h', '--help', action='store_true')
+    parser.add_argument('-v', '--version', action='store_true')
+    parser.add_argument('-p', '--parameter')
+    parser.add_argument('-lvl', '--level', type=int)
+    parser.add_argument('--no-browser', action='store_true')
+    return parser
+
+
+def _not_understood(prog):
+    print(f'{prog}: command not understood. '
+          f'Type "{prog} --help" for usage information.')
+
+
+def _parse_args(parser, args):
+    """Parse args in a single pass, returns None if they are not understood."""
+    try:
+        return parser.parse_args([str(arg) for arg in args])
+    except _ArgumentError:
+        _not_understood(parser.prog)
+        return None
+
+
 HELP = """era5vis_modellevel: Visualization of ERA5 at a given model level.
 
 Usage:
@@ -36,43 +78,36 @@ def modellevel(args):
         output of sys.args[1:]
     """
 
-    if '--parameter' in args:
-        args[args.index('--parameter')] = '-p'
-    if '--level' in args:
-        args[args.index('--level')] = '-lvl'
-    if '--time' in args:
-        args[args.index('--time')] = '-t'
-    if '--time_index' in args:
-        args[args.index('--time_index')] = '-ti'
+    parser = _make_parser('era5vis_modellevel')
+    parser.add_argument('-t', '--time')
+    parser.add_argument('-ti', '--time_index', type=int)
+    opts = _parse_args(parser, args)
 
-    if len(args) == 0:
+    if opts is None:
+        return
+    elif len(args) == 0 or opts.help:
         print(HELP)
-    elif args[0] in ['-h', '--help']:
-        print(HELP)
-    elif args[0] in ['-v', '--version']:
+    elif opts.version:
         print('era5vis_modellevel: ' + era5vis.__version__)
         print('Licence: public domain')
         print('era5vis_modellevel is provided "as is", without warranty of any kind')
     # parameter and level must be provided, time/time_ind are optional
-    elif ('-p' in args) and ('-lvl' in args):
-        param = args[args.index('-p') + 1]
-        level = int(args[args.index('-lvl') + 1])
-        if ('-t' in args):
-            time = args[args.index('-t') + 1]
-            html_path = era5vis.write_html(param, level=level, time=time)
-        elif ('-ti' in args):
-            time = int(args[args.index('-ti') + 1])
-            html_path = era5vis.write_html(param, level=level, time_ind=time)
+    elif (opts.parameter is not None) and (opts.level is not None):
+        param = opts.parameter
+        level = opts.level
+        if opts.time is not None:
+            html_path = era5vis.write_html(param, level=level, time=opts.time)
+        elif opts.time_index is not None:
+            html_path = era5vis.write_html(param, level=level, time_ind=opts.time_index)
         else:
             print('No time provided, using default (first time in the file)')
             html_path = era5vis.write_html(param, level=level, time_ind=0)
-        if '--no-browser' in args:
+        if opts.no_browser:
             print('File successfully generated at: ' + str(html_path))
         else:
             webbrowser.get().open_new_tab('file://' + str(html_path))
     else:
-        print('era5vis_modellevel: command not understood. '
-              'Type "era5vis_modellevel --help" for usage information.')
+        _not_understood(parser.prog)
 
 
 def era5vis_modellevel():
@@ -105,6 +140,10 @@ def clim(args):
     args: list
         output of sys.args[1:]
     """
+    # no interactive backend needed, the plots are only written to files
+    import matplotlib
+    matplotlib.use('Agg')
+
     from era5vis.download_era5 import download_era5, parse_month
     from era5vis.Plot_map_anomaly import Plot_map_anomaly
     from era5vis.Soundings import plot_sounding
@@ -112,35 +151,31 @@ def clim(args):
 
     from era5vis.crosssection import plot_crosssection
 
-
-
-    if '--year' in args:
-        args[args.index('--year')] = '-y'
-    if '--month' in args:
-        args[args.index('--month')] = '-m'
-    if '--parameter' in args:
-        args[args.index('--parameter')] = '-p'
-    if '--level' in args:
-        args[args.index('--level')] = '-lvl'
-
+    parser = _make_parser('era5vis_clim')
+    parser.add_argument('-y', '--year')
+    parser.add_argument('-m', '--month')
+    parser.add_argument('-lat', '--latitude', type=float, default=62.5)
+    parser.add_argument('-lon', '--longitude', type=float, default=-10.0)
+    parser.set_defaults(parameter='t', level=500)
+    opts = _parse_args(parser, args)
+    if opts is None:
+        return
 
     #arguments for Plotting and sounding
-    param = args[args.index('-p') + 1] if '-p' in args else 't'
-    level = int(args[args.index('-lvl') + 1]) if '-lvl' in args else 500
-    lon_pt = float(args[args.index('-lon') + 1]) if '--lon' in args else -10.0
-    lat_pt = float(args[args.index('-lat') + 1]) if '--lat' in args else 62.5 
+    param = opts.parameter
+    level = opts.level
+    lon_pt = opts.longitude
+    lat_pt = opts.latitude
 
-    if len(args) == 0:
-        print(HELP_CLIM)
-    elif args[0] in ['-h', '--help']:
+    if len(args) == 0 or opts.help:
         print(HELP_CLIM)
-    elif args[0] in ['-v', '--version']:
+    elif opts.version:
         print('era5vis_clim: ' + era5vis.__version__)
         print('Licence: public domain')
         print('era5vis_clim is provided "as is", without warranty of any kind')
-    elif ('-y' in args) and ('-m' in args):
-        year = args[args.index('-y') + 1]  # getting the year from user input
-        month_input = args[args.index('-m') + 1]  # getting the month from user input
+    elif (opts.year is not None) and (opts.month is not None):
+        year = opts.year  # getting the year from user input
+        month_input = opts.month  # getting the month from user input
         
         # Convert month name to number if needed
         try:
@@ -156,21 +191,18 @@ def clim(args):
         print(f'Data downloaded to: {filepath}')
         date=f"{month} {year}"
          
-        png1 = Plot_map_anomaly(filepath, param,level,lat_pt,lon_pt)
-        png2=plot_sounding(filepath,lat_pt,lon_pt)
-
-        png3 = plot_crosssection(
-        param,
-        lat=lat_pt,
-        lon=lon_pt,
-        casefile=filepath)
-
+        # the plots are independent of each other, so draw them in parallel
+        with ProcessPoolExecutor(max_workers=3, initializer=matplotlib.use,
+                                 initargs=('Agg',)) as ex:
+            f1 = ex.submit(Plot_map_anomaly, filepath, param, level, lat_pt, lon_pt)
+            f2 = ex.submit(plot_sounding, filepath, lat_pt, lon_pt)
+            f3 = ex.submit(plot_crosssection, filepath, lat_pt, lon_pt, param)
+            png1, png2, png3 = f1.result(), f2.result(), f3.result()
 
         build_html(png1, png2, png3, date)
 
     else:
-        print('era5vis_clim: command not understood. '
-              'Type "era5vis_clim --help" for usage information.')
+        _not_understood(parser.prog)
 
 
 def era5vis_clim():
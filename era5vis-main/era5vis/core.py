@@ -1,5 +1,6 @@
 """Plenty of useful functions doing useful things.  """
 
+from functools import lru_cache
 from pathlib import Path
 from tempfile import mkdtemp
 import shutil
@@ -23,15 +24,30 @@ def mkdir(path, reset=False):
         path to directory
     """
     
-    if reset and Path.is_dir(path):
+    if reset and Path(path).is_dir():
         shutil.rmtree(path)
-    try:
-        Path.mkdir(path, parents=True)
-    except FileExistsError:
-        pass
+    Path(path).mkdir(parents=True, exist_ok=True)
     return path
 
 
+@lru_cache(maxsize=None)
+def read_template(path):
+    """Read an HTML template once, later calls return the cached text.
+
+    Parameters
+    ----------
+    path: str or pathlib.Path
+        path to the template, placeholders are in str.format syntax
+
+    Returns
+    -------
+    template: str
+        content of the template file
+    """
+
+    return Path(path).read_text()
+
+
 def write_html(param, level=None, time=None, time_ind=None, directory=None):
     """ Create HTML with ERA5 plot 
     
@@ -68,15 +84,8 @@ def write_html(param, level=None, time=None, time_ind=None, directory=None):
 
     # create HTML from template
     outpath = Path(directory) / 'index.html'
-    with open(cfg.html_template, 'r') as infile:
-        lines = infile.readlines()
-        out = []
-        for txt in lines:
-            txt = txt.replace('[PLOTTYPE]', 'Horizontal cross-section')
-            txt = txt.replace('[PLOTVAR]', param)
-            txt = txt.replace('[IMGTYPE]', png.name)
-            out.append(txt)
-        with open(outpath, 'w') as outfile:
-            outfile.writelines(out)
+    html = read_template(cfg.html_template).format_map(
+        {'PLOTTYPE': 'Horizontal cross-section', 'PLOTVAR': param, 'IMGTYPE': png.name})
+    outpath.write_text(html)
 
     return outpath
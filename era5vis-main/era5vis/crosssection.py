@@ -42,13 +42,16 @@ atmosphere formula, then:
 
 from __future__ import annotations
 
-import calendar
+from functools import lru_cache
 import numpy as np
 import xarray as xr
 import matplotlib.pyplot as plt
 from matplotlib.colors import Normalize
+from matplotlib.ticker import FixedLocator, NullLocator, ScalarFormatter
 import os
 
+from era5vis import era5
+
 # --- constants / defaults (kept simple) ---
 G0 = 9.80665
 
@@ -65,14 +68,24 @@ W_VAR = "w"
 
 CLIM_REF_PERIOD = "1991–2020"
 
-NLEVELS_FILL = 21
+# fixed English month abbreviations (index = month number), independent of the locale
+_MONTH_ABBR = ("", "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+               "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
 NLEVELS_GEO = 12
+PRESSURE_TICKS = [1000, 850, 700, 500, 400, 300, 200, 100]
 
 QUIVER_X_SKIP = 5
 QUIVER_Y_SKIP = 1
 QUIVER_SCALE = 5.0
 W_EXAG = 1000.0
 
+# standard atmosphere for the terrain height -> pressure conversion
+STD_T0 = 288.15        # K
+STD_LAPSE_RATE = 0.0065  # K/m
+STD_P0_HPA = 1000.0
+STD_EXPONENT = (G0 * 0.0289644) / (8.3144598 * STD_LAPSE_RATE)  # g*M/(R*L)
+
 
 # FIELPATHS
 from pathlib import Path
@@ -88,7 +101,8 @@ TERRAIN_VAR = "z"
 
 
 def plot_crosssection(casefile, lat, lon, var,*,  climfile = CLIMFILE_DEFAULT, field="anomaly",
-                      terrainfile=TERRAIN_FILE_DEFAULT, savepath=None):
+                      terrainfile=TERRAIN_FILE_DEFAULT, savepath=None, fig=None,
+                      interp_method="nearest"):
     """
     Main function.
 
@@ -97,32 +111,42 @@ def plot_crosssection(casefile, lat, lon, var,*,  climfile = CLIMFILE_DEFAULT, f
     var : str
         Variable name (e.g. "t", "q", "wspd").
     lat, lon : float
-        Location for the cross-sections (nearest grid point is used).
+        Location for the cross-sections (see interp_method).
     casefile : str
-        Case dataset (usually one timestep).
+        Case dataset (usually one timestep), NetCDF or '.zarr' store.
     climfile : str
-        Monthly climatology (month=1..12).
+        Monthly climatology (month=1..12), NetCDF or '.zarr' store.
     field : str
         "anomaly" (default), "case", or "clim".
     terrainfile : str or None
-        If given: adds a terrain line + white mask.
+        If given: adds a terrain line + white mask (NetCDF or '.zarr' store).
     savepath : str or None
         If given: saves the plot and closes the figure.
+    fig : matplotlib.figure.Figure or None
+        If given: the figure is reused (and not closed), which is much faster
+        when plotting many cross-sections in a row.
+    interp_method : str
+        "nearest" (default): sections along the nearest grid lines.
+        "bicubic": sections exactly through lat/lon, interpolated from the four
+        surrounding grid lines with a cubic convolution kernel.
     """
     if field not in ("anomaly", "case", "clim"):
         raise ValueError("field must be one of: 'anomaly', 'case', 'clim'.")
+    if interp_method not in ("nearest", "bicubic"):
+        raise ValueError("interp_method must be one of: 'nearest', 'bicubic'.")
 
-    ds_case = xr.open_dataset(casefile)
-    ds_case2 = drop_time(ds_case)
+    # open lazily (NetCDF or Zarr) and keep only the variables plotted, so only
+    # their chunks are read
+    ds_case = era5.open_dataset(casefile, mask_and_scale=True)
+    ds_case2 = drop_time(ds_case[[v for v in (var, U_VAR, V_VAR, W_VAR) if v in ds_case]])
 
     # month/year from case time
     case_month, case_year = get_case_month_year(ds_case)
-    month_short = calendar.month_abbr[case_month]
+    month_short = _MONTH_ABBR[case_month]
     month_year_text = f"{month_short} {case_year}"
 
     # read clim for that month
-    ds_clim_all = xr.open_dataset(climfile)
-    ds_clim = ds_clim_all.sel({MONTH_DIM: case_month}).squeeze(drop=True)
+    ds_clim = _open_clim(climfile, case_month, var)
 
     if GEO_VAR not in ds_clim:
         raise KeyError(f"'{GEO_VAR}' must exist in climatology file for the background.")
@@ -133,10 +157,17 @@ def plot_crosssection(casefile, lat, lon, var,*,  climfile = CLIMFILE_DEFAULT, f
     if field in ("clim", "anomaly") and var not in ds_clim:
         raise KeyError(f"'{var}' not found in climatology file (needed for field='{field}').")
 
+    # grid indices (and weights), looked up once per file and reused for every field
+    ilat_case = section_indexer(ds_case2[LAT_DIM], lat, interp_method)
+    ilon_case = section_indexer(ds_case2[LON_DIM], lon, interp_method)
+    ilat_clim = section_indexer(ds_clim[LAT_DIM], lat, interp_method)
+    ilon_clim = section_indexer(ds_clim[LON_DIM], lon, interp_method)
+
     # background (clim geopotential height)
     z_bg = ds_clim[GEO_VAR] / G0
-    z_lat = to_2d(z_bg.sel({LAT_DIM: lat}, method="nearest"))
-    z_lon = to_2d(z_bg.sel({LON_DIM: lon}, method="nearest"))
+    # float32 is plenty for plotting and halves the bytes the drawing passes touch
+    z_lat = to_2d(cut_section(z_bg, LAT_DIM, ilat_clim)).load().astype(np.float32, copy=False)
+    z_lon = to_2d(cut_section(z_bg, LON_DIM, ilon_clim)).load().astype(np.float32, copy=False)
 
     # nice name
     pretty_name = pretty_var_name(var, ds_case2, ds_clim)
@@ -160,36 +191,47 @@ def plot_crosssection(casefile, lat, lon, var,*,  climfile = CLIMFILE_DEFAULT, f
         fld = ds_clim[var]
         mode_text = "CLIM"
     else:
-        case_a, clim_a = xr.align(ds_case2[[var]], ds_clim[[var]], join="exact")
-        fld = case_a[var] - clim_a[var]
+        case_da, clim_da = ds_case2[var], ds_clim[var]
+        # check the grids once, then subtract the arrays without xarray alignment
+        if case_da.dims != clim_da.dims or not all(
+                np.array_equal(case_da[d].values, clim_da[d].values) for d in case_da.dims):
+            raise ValueError(f"Case and climatology '{var}' are not on the same grid.")
+        fld = case_da.copy(data=case_da.data - clim_da.data)
         mode_text = "ANOMALY"
 
-    # color scaling
+    # color scaling, one reduction over the raw (numpy or dask) array
     if mode_text == "ANOMALY":
-        vmax = float(max(abs(fld.min()), abs(fld.max())))
+        vmax = float(np.nanmax(np.abs(fld.data)))
         norm = Normalize(-vmax, vmax)
         cmap = "coolwarm"
     else:
-        vmax = float(fld.max())
+        vmax = float(np.nanmax(fld.data))
         norm = Normalize(0.0, vmax)
         cmap = "Blues" if var == "wspd" else "viridis"
 
     # extract 2D sections
-    fld_lat = to_2d(fld.sel({LAT_DIM: lat}, method="nearest"))
-    fld_lon = to_2d(fld.sel({LON_DIM: lon}, method="nearest"))
+    ilat, ilon = (ilat_clim, ilon_clim) if effective_field == "clim" else (ilat_case, ilon_case)
+    fld_lat = to_2d(cut_section(fld, LAT_DIM, ilat)).load().astype(np.float32, copy=False)
+    fld_lon = to_2d(cut_section(fld, LON_DIM, ilon)).load().astype(np.float32, copy=False)
 
-    lat_used = float(fld.sel({LAT_DIM: lat}, method="nearest")[LAT_DIM].values)
-    lon_used = float(fld.sel({LON_DIM: lon}, method="nearest")[LON_DIM].values)
+    if interp_method == "nearest":
+        lat_used = float(fld[LAT_DIM].values[ilat])
+        lon_used = float(fld[LON_DIM].values[ilon])
+    else:
+        lat_used, lon_used = float(lat), float(lon)
 
     # arrows (only for wspd; always from CASE)
-    u = v = w = None
+    u_we = w_we = v_sn = w_sn = None
     if var == "wspd":
         for needed in (U_VAR, V_VAR, W_VAR):
             if needed not in ds_case2:
                 raise KeyError(f"Case file missing '{needed}' required for wind arrows (wspd).")
-        u = ds_case2[U_VAR]
-        v = ds_case2[V_VAR]
-        w = ds_case2[W_VAR]
+        # one selection per panel on the wind subset instead of one per variable
+        wind = ds_case2[[U_VAR, V_VAR, W_VAR]]
+        wind_we = cut_section(wind, LAT_DIM, ilat_case).load().astype(np.float32, copy=False)
+        wind_sn = cut_section(wind, LON_DIM, ilon_case).load().astype(np.float32, copy=False)
+        u_we, w_we = to_2d(wind_we[U_VAR]), to_2d(wind_we[W_VAR])
+        v_sn, w_sn = to_2d(wind_sn[V_VAR]), to_2d(wind_sn[W_VAR])
 
     # terrain lines (optional)
     terr_we = terr_sn = None
@@ -203,30 +245,39 @@ def plot_crosssection(casefile, lat, lon, var,*,  climfile = CLIMFILE_DEFAULT, f
 
     cb_label = f"{pretty_name} [{units}]" if units else pretty_name
 
-    fig, axes = plt.subplots(2, 1, figsize=(10.5, 9.2), constrained_layout=True)
+    own_fig = fig is None
+    if own_fig:
+        fig = plt.figure(figsize=(10.5, 9.2), constrained_layout=True)
+    axes, cbars = _panel_axes(fig)
     fig.suptitle(title_line, x=0.01, ha="left")
 
-    plot_panel_we(axes[0], fld_lat, z_lat, lon_used, lat_used, norm, cmap, cb_label, u, w, terr_we)
-    plot_panel_sn(axes[1], fld_lon, z_lon, lat_used, lon_used, norm, cmap, cb_label, v, w, terr_sn)
+    cbars = (
+        plot_panel_we(axes[0], fld_lat, z_lat, lon_used, lat_used, norm, cmap, cb_label, u_we, w_we, terr_we,
+                      cb=cbars[0]),
+        plot_panel_sn(axes[1], fld_lon, z_lon, lat_used, lon_used, norm, cmap, cb_label, v_sn, w_sn, terr_sn,
+                      cb=cbars[1]),
+    )
+    # keep the colorbars with the figure so a reused figure only updates them
+    fig._era5_cbars = cbars
 
     if savepath is not None:
         fig.savefig(savepath, dpi=180)
-        plt.close(fig)
+        if own_fig:
+            plt.close(fig)
 
     ds_case.close()
-    ds_clim_all.close()
     
 
     outdir = "PNG"
-    if not os.path.isdir(outdir):
-        os.makedirs(outdir)
+    Path(outdir).mkdir(parents=True, exist_ok=True)
 
     safe_date = month_year_text.replace(" ", "_")
     fname = f"ERA5_crosssection_{var}_{safe_date}.png"
     outpath = os.path.join(outdir, fname)
 
     fig.savefig(outpath, dpi=180, bbox_inches="tight")
-    plt.close(fig)
+    if own_fig:
+        plt.close(fig)
 
     return fname
 
@@ -244,6 +295,18 @@ def drop_time(ds):
     return ds
 
 
+@lru_cache(maxsize=8)
+def _open_clim(climfile, month, var):
+    """Climatology of one month, read once and kept in memory for later plots.
+
+    Only the geopotential and var are loaded (those the plot needs), so each
+    cached entry holds two 3D fields of one month.
+    """
+    with era5.open_dataset(climfile, mask_and_scale=True) as ds_clim_all:
+        ds_clim_all = ds_clim_all[[v for v in (GEO_VAR, var) if v in ds_clim_all]]
+        return ds_clim_all.sel({MONTH_DIM: month}).squeeze(drop=True).load()
+
+
 def get_case_month_year(ds_case):
 
     """Return (month, year) from valid_time or time coordinate."""
@@ -264,6 +327,49 @@ def get_case_month_year(ds_case):
     return int(dt.month.values), int(dt.year.values)
 
 
+def nearest_index(coord_1d, value):
+    """Index of the coordinate value closest to value."""
+    return int(np.abs(coord_1d.values - value).argmin())
+
+
+def cubic_kernel(x, a=-0.5):
+    """Keys cubic convolution kernel (a=-0.5 gives bicubic interpolation)."""
+    x = np.abs(x)
+    return np.where(x <= 1, (a + 2) * x**3 - (a + 3) * x**2 + 1,
+                    np.where(x < 2, a * x**3 - 5 * a * x**2 + 8 * a * x - 4 * a, 0.0))
+
+
+def section_indexer(coord_1d, value, interp_method="nearest"):
+    """
+    Where to cut a section at coord = value.
+
+    "nearest": the index of the closest grid line.
+    "bicubic": the indices of the four surrounding grid lines and their
+    cubic convolution weights (regular grids only, edges are repeated).
+    """
+    if interp_method == "nearest":
+        return nearest_index(coord_1d, value)
+
+    c = coord_1d.values
+    step = c[1] - c[0]
+    if not np.allclose(np.diff(c), step):
+        raise ValueError(f"Bicubic sections need a regular '{coord_1d.name}' grid.")
+    pos = (value - c[0]) / step
+    i = int(np.floor(pos))
+    offsets = np.arange(-1, 3)
+    idx = np.clip(i + offsets, 0, c.size - 1)
+    return idx, cubic_kernel(pos - i - offsets)
+
+
+def cut_section(obj, dim, indexer):
+    """Cut a DataArray/Dataset at an indexer from section_indexer."""
+    if isinstance(indexer, int):
+        return obj.isel({dim: indexer})
+    idx, weights = indexer
+    # one weighted sum over the four grid lines, the same weights for all levels
+    return (obj.isel({dim: idx}) * xr.DataArray(weights, dims=dim)).sum(dim)
+
+
 def pretty_var_name(var, ds_case2, ds_clim):
     """Try to build: 'var – long_name'. Fallback: just var."""
     long_name = ""
@@ -275,36 +381,70 @@ def pretty_var_name(var, ds_case2, ds_clim):
 
 
 def to_2d(da):
-    """Make sure contourf gets a 2D array (drop singleton dims like expver/number)."""
+    """Make sure the plotting functions get a 2D array (drop singleton dims like expver/number)."""
     out = da.squeeze(drop=True)
-    while out.ndim > 2:
-        out = out.isel({out.dims[0]: 0}).squeeze(drop=True)
-    return out
+    if out.ndim <= 2:
+        return out
+    # take the first entry of every extra leading dim on the plain array
+    values = out.values
+    while values.ndim > 2:
+        values = values[0]
+    dims = out.dims[-2:]
+    return xr.DataArray(values, coords={d: out.coords[d] for d in dims if d in out.coords},
+                        dims=dims, name=out.name, attrs=out.attrs)
 
 
 def add_background(ax, x, y, z2d):
-    ax.contourf(x, y, z2d, levels=NLEVELS_GEO, cmap="Greys", alpha=0.18)
+    # regular (x, pressure) grid: shade cells directly, only the isolines are contoured
+    ax.pcolormesh(x, y, z2d, shading="auto", cmap="Greys", alpha=0.18)
     ax.contour(x, y, z2d, levels=NLEVELS_GEO, colors="#667085", linewidths=0.6, alpha=0.65)
 
 
-def add_colorbar(fig, ax, mappable, label):
-    cb = fig.colorbar(mappable, ax=ax, pad=0.02, shrink=0.98)
+def add_colorbar(fig, ax, mappable, label, cb=None):
+    """Add a colorbar, or point an existing one (cb) at the new mappable."""
+    if cb is None:
+        cb = fig.colorbar(mappable, ax=ax, pad=0.02, shrink=0.98)
+    else:
+        cb.update_normal(mappable)
     cb.set_label(label)
+    return cb
+
+
+def _panel_axes(fig):
+    """Return the two panel axes and colorbars of fig, cleared for a new plot."""
+    axes = [ax for ax in fig.axes if getattr(ax, "_era5_panel", False)]
+    if len(axes) == 2:
+        for ax in axes:
+            ax.clear()
+        return axes, fig._era5_cbars
+    fig.clear()
+    axes = fig.subplots(2, 1)
+    for ax in axes:
+        ax._era5_panel = True
+    return axes, (None, None)
+
+
+def set_pressure_axis(ax, y):
+    """Log-pressure y-axis from the largest (bottom) to the smallest level (top)."""
+    ax.set_yscale("log")
+    ax.set_ylim(float(y.max()), float(y.min()))
+    # label the pressure levels with plain numbers instead of powers of ten
+    ax.yaxis.set_major_locator(FixedLocator(PRESSURE_TICKS))
+    ax.yaxis.set_major_formatter(ScalarFormatter())
+    ax.yaxis.set_minor_locator(NullLocator())
 
 
 def add_quiver(ax, xdim, horiz, vert):
-    """Add wind arrows from horiz (=u or v) and vert (=w)."""
-    hq = horiz.isel({xdim: slice(None, None, QUIVER_X_SKIP),
-                    LEVEL_DIM: slice(None, None, QUIVER_Y_SKIP)})
-    vq = vert.isel({xdim: slice(None, None, QUIVER_X_SKIP),
-                    LEVEL_DIM: slice(None, None, QUIVER_Y_SKIP)})
+    """Add wind arrows from 2D horiz (=u or v) and vert (=w) sections."""
+    # stride the numpy arrays directly, all in (level, x) order
+    step = (slice(None, None, QUIVER_Y_SKIP), slice(None, None, QUIVER_X_SKIP))
+    U = horiz.transpose(LEVEL_DIM, xdim).values[step]
+    V = vert.transpose(LEVEL_DIM, xdim).values[step] * (W_EXAG / 100.0)  # Pa/s -> hPa/s and exaggerate
 
-    X, Y = xr.broadcast(hq[xdim], hq[LEVEL_DIM])
-    U = hq.values
-    V = (vq / 100.0 * W_EXAG).values  # Pa/s -> hPa/s and exaggerate
+    X, Y = np.meshgrid(horiz[xdim].values[step[1]], horiz[LEVEL_DIM].values[step[0]], indexing="xy")
 
     ax.quiver(
-        X.values, Y.values, U, V,
+        X, Y, U, V,
         angles="xy", scale_units="xy", scale=QUIVER_SCALE,
         width=0.0035, headwidth=4.8, headlength=6.2, headaxislength=5.5, alpha=0.9,
     )
@@ -315,17 +455,28 @@ def height_to_pressure_hpa(z_m):
     Convert height (m) to approximate pressure (hPa) using standard atmosphere.
     Only used for the terrain mask in pressure coordinates.
     """
-    T0 = 288.15
-    L = 0.0065
-    g = 9.80665
-    M = 0.0289644
-    R = 8.3144598
-    p0 = 100000.0  # Pa
+    # float32 is plenty for plotting; clip makes the one copy, the rest is in place
+    p = np.clip(np.asarray(z_m, dtype=np.float32), 0.0, None)
+    np.multiply(p, -STD_LAPSE_RATE / STD_T0, out=p)
+    np.add(p, 1.0, out=p)
+    np.power(p, STD_EXPONENT, out=p)
+    np.multiply(p, STD_P0_HPA, out=p)
+    return p
 
-    z = np.maximum(z_m, 0.0)
-    exponent = (g * M) / (R * L)
-    p_pa = p0 * (1.0 - (L * z / T0)) ** exponent
-    return p_pa / 100.0  # hPa
+
+@lru_cache(maxsize=4)
+def _load_terrain_pressure(terrainfile):
+    """Terrain of terrainfile as a 2D surface pressure field (hPa), read once per file."""
+    with era5.open_dataset(terrainfile, mask_and_scale=True) as ds_terr:
+        ds_terr2 = drop_time(ds_terr)
+
+        if TERRAIN_VAR not in ds_terr2:
+            raise KeyError(f"Terrain file does not contain variable '{TERRAIN_VAR}'.")
+
+        terr_m = to_2d(ds_terr2[TERRAIN_VAR]).load()
+
+    return xr.DataArray(height_to_pressure_hpa(terr_m.values), coords=terr_m.coords,
+                        dims=terr_m.dims, attrs={"units": "hPa"})
 
 
 def load_terrain_lines(terrainfile, lat_used, lon_used):
@@ -334,85 +485,61 @@ def load_terrain_lines(terrainfile, lat_used, lon_used):
       - W–E: p_sfc(lon) at fixed latitude
       - S–N: p_sfc(lat) at fixed longitude
     """
-    ds_terr = xr.open_dataset(terrainfile)
-    ds_terr2 = drop_time(ds_terr)
-
-    if TERRAIN_VAR not in ds_terr2:
-        ds_terr.close()
-        raise KeyError(f"Terrain file does not contain variable '{TERRAIN_VAR}'.")
+    terr_p = _load_terrain_pressure(terrainfile)
 
-    terr_m = ds_terr2[TERRAIN_VAR]
-
-    terr_we_m = to_2d(terr_m.sel({LAT_DIM: lat_used}, method="nearest"))
-    terr_sn_m = to_2d(terr_m.sel({LON_DIM: lon_used}, method="nearest"))
-
-    terr_we_p = xr.DataArray(
-        height_to_pressure_hpa(terr_we_m.values),
-        coords={LON_DIM: terr_we_m[LON_DIM]},
-        dims=(LON_DIM,),
-    )
-    terr_sn_p = xr.DataArray(
-        height_to_pressure_hpa(terr_sn_m.values),
-        coords={LAT_DIM: terr_sn_m[LAT_DIM]},
-        dims=(LAT_DIM,),
-    )
+    terr_we_p = terr_p.isel({LAT_DIM: nearest_index(terr_p[LAT_DIM], lat_used)}, drop=True)
+    terr_sn_p = terr_p.isel({LON_DIM: nearest_index(terr_p[LON_DIM], lon_used)}, drop=True)
 
-    ds_terr.close()
     return terr_we_p, terr_sn_p
 
 
-def mask_terrain_white(ax, x1d, p_sfc_hpa):
-    """Fill below the terrain with white (ground mask)."""
-    ymin, ymax = ax.get_ylim()
-    pmax = max(ymin, ymax)  # bottom (largest pressure)
-    ax.fill_between(x1d.values, p_sfc_hpa.values, pmax, color="white", zorder=10)
+def mask_terrain_white(ax, x1d, p_sfc_hpa, pmax):
+    """Fill below the terrain (numpy arrays) down to pmax with white (ground mask)."""
+    ax.fill_between(np.asarray(x1d, dtype=np.float32), np.asarray(p_sfc_hpa, dtype=np.float32),
+                    pmax, color="white", zorder=10)
 
 
-def plot_panel_we(ax, fld2d, z2d, lon_used, lat_used, norm, cmap, cb_label, u, w, terrain_line):
+def plot_panel_we(ax, fld2d, z2d, lon_used, lat_used, norm, cmap, cb_label, u2, w2, terrain_line, cb=None):
     x = fld2d[LON_DIM]
     y = fld2d[LEVEL_DIM]
 
     add_background(ax, x, y, z2d)
-    cf = ax.contourf(x, y, fld2d, levels=NLEVELS_FILL, cmap=cmap, norm=norm)
+    cf = ax.pcolormesh(x, y, fld2d, shading="auto", cmap=cmap, norm=norm)
 
-    if u is not None and w is not None:
-        u2 = to_2d(u.sel({LAT_DIM: lat_used}, method="nearest"))
-        w2 = to_2d(w.sel({LAT_DIM: lat_used}, method="nearest"))
+    if u2 is not None and w2 is not None:
         add_quiver(ax, LON_DIM, u2, w2)
 
-    ax.invert_yaxis()
+    set_pressure_axis(ax, y)
 
     if terrain_line is not None:
-        mask_terrain_white(ax, x, terrain_line)
+        mask_terrain_white(ax, x.values, terrain_line.values, float(y.max()))
         ax.plot(terrain_line[LON_DIM], terrain_line.values, color="k", linewidth=1.3, zorder=11)
 
     ax.axvline(lon_used, color="k", linestyle=":", linewidth=1.1, alpha=0.7)
     ax.set_title(f"W–E at {LAT_DIM}≈{lat_used:.2f}")
     ax.set_xlabel(LON_DIM)
     ax.set_ylabel(LEVEL_DIM)
-    add_colorbar(ax.figure, ax, cf, cb_label)
+    return add_colorbar(ax.figure, ax, cf, cb_label, cb)
 
 
-def plot_panel_sn(ax, fld2d, z2d, lat_used, lon_used, norm, cmap, cb_label, v, w, terrain_line):
+def plot_panel_sn(ax, fld2d, z2d, lat_used, lon_used, norm, cmap, cb_label, v2, w2, terrain_line, cb=None):
     x = fld2d[LAT_DIM]
     y = fld2d[LEVEL_DIM]
 
     add_background(ax, x, y, z2d)
-    cf = ax.contourf(x, y, fld2d, levels=NLEVELS_FILL, cmap=cmap, norm=norm)
+    cf = ax.pcolormesh(x, y, fld2d, shading="auto", cmap=cmap, norm=norm)
 
-    if v is not None and w is not None:
-        v2 = to_2d(v.sel({LON_DIM: lon_used}, method="nearest"))
-        w2 = to_2d(w.sel({LON_DIM: lon_used}, method="nearest"))
+    if v2 is not None and w2 is not None:
         add_quiver(ax, LAT_DIM, v2, w2)
 
-    ax.invert_yaxis()
+    set_pressure_axis(ax, y)
 
     if terrain_line is not None:
-        mask_terrain_white(ax, x, terrain_line)
+        mask_terrain_white(ax, x.values, terrain_line.values, float(y.max()))
         ax.plot(terrain_line[LAT_DIM], terrain_line.values, color="k", linewidth=1.3, zorder=11)
 
     ax.axvline(lat_used, color="k", linestyle=":", linewidth=1.1, alpha=0.7)
     ax.set_title(f"S–N at {LON_DIM}≈{lon_used:.2f}")
     ax.set_xlabel(LAT_DIM)
     ax.set_ylabel(LEVEL_DIM)
-    add_colorbar(ax.figure, ax, cf, cb_label)
\ No newline at end of file
+    return add_colorbar(ax.figure, ax, cf, cb_label, cb)
\ No newline at end of file
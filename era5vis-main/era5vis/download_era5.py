@@ -1,5 +1,8 @@
 #This file was created by Kilian
 
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import cdsapi
 
@@ -19,6 +22,11 @@ MONTH_NAMES = {
     'oktober': '10', 'dezember': '12',
 }
 
+# All accepted inputs in one lookup: numbers with and without leading zero and names
+MONTH_LOOKUP = ({str(i): f'{i:02d}' for i in range(1, 13)}
+                | {f'{i:02d}': f'{i:02d}' for i in range(1, 13)}
+                | MONTH_NAMES)
+
 
 def parse_month(month_input: str) -> str:
     """Convert month name or number to two-digit month string.
@@ -32,21 +40,10 @@ def parse_month(month_input: str) -> str:
     Raises:
         ValueError: If month cannot be parsed
     """
-    # Try as number first
-    try:
-        month_num = int(month_input)
-        if 1 <= month_num <= 12:
-            return f'{month_num:02d}'
-        else:
-            raise ValueError(f"Month number must be 1-12, got {month_num}")
-    except ValueError:
-        pass
-    
-    # Try as month name
-    month_lower = month_input.lower()
-    if month_lower in MONTH_NAMES:
-        return MONTH_NAMES[month_lower]
-    
+    month = MONTH_LOOKUP.get(month_input.strip().lower())
+    if month is not None:
+        return month
+
     raise ValueError(
         f"Could not parse month '{month_input}'. "
         "Use a number (1-12) or name (e.g., 'January', 'März')."
@@ -71,31 +68,76 @@ TIME = "00:00"
 TARGET = Path("./era5_data.nc")
 
 
-def download_era5(year: str, month: str) -> Path:
+def build_request(year: str | list[str], month: str | list[str]) -> dict:
     """
-    Download ERA5 monthly mean pressure level data from the Copernicus Climate Data Store.
-    The the fixed variables and configurations are defined above the function definition 
+    Build the CDS request for the fixed variables and settings defined above.
 
     Args:
-        year: Year to download (e.g., "2024").
-        month: Month to download (e.g., "03").
+        year: Year or list of years (e.g., "2024" or ["2023", "2024"]).
+        month: Month or list of months (e.g., "03" or ["01", "02"]).
 
     Returns:
-        Path to the downloaded NetCDF file.
+        Request dictionary for cdsapi.Client.retrieve.
     """
-    request = {
+    return {
         'product_type': [PRODUCT_TYPE],
         'variable': VARIABLES,
-        'year': [year],
-        'month': [month],
+        'year': [year] if isinstance(year, str) else list(year),
+        'month': [month] if isinstance(month, str) else list(month),
         'time': [TIME],
         'pressure_level': PRESSURE_LEVELS,
         'data_format': 'netcdf',
         'area': AREA,
     }
 
+
+def download_era5(year: str | list[str], month: str | list[str], target: Path = TARGET) -> Path:
+    """
+    Download ERA5 monthly mean pressure level data from the Copernicus Climate Data Store.
+    The the fixed variables and configurations are defined above the function definition 
+
+    Several years and/or months are fetched with one request into one file,
+    which saves the CDS queueing and connection overhead of one request each.
+
+    Args:
+        year: Year or list of years to download (e.g., "2024" or ["2023", "2024"]).
+        month: Month or list of months to download (e.g., "03" or ["01", "02"]).
+        target: Output NetCDF file.
+
+    Returns:
+        Path to the downloaded NetCDF file.
+    """
     client = cdsapi.Client()
-    client.retrieve(DATASET, request, TARGET)
+    client.retrieve(DATASET, build_request(year, month), target)
+
+    return Path(target)
+
+
+def _retrieve(request: dict, target: Path) -> Path:
+    """Run one CDS request with its own client (clients are not shared between threads)."""
+    cdsapi.Client().retrieve(DATASET, request, target)
+    return Path(target)
+
 
-    return TARGET
+def download_many(requests: list[dict], targets: list[Path], max_workers: int = 4) -> list[Path]:
+    """
+    Run several CDS requests at the same time, e.g. when they cannot be
+    combined into one request because the areas differ.
+
+    The jobs spend most of their time waiting in the CDS queue, so threads are
+    enough to overlap them: the wall time is about the longest job instead of
+    the sum of all jobs.
+
+    Args:
+        requests: Request dictionaries, e.g. from build_request.
+        targets: Output NetCDF file for each request.
+        max_workers: Number of requests submitted at the same time.
+
+    Returns:
+        Paths to the downloaded NetCDF files, in the order of the requests.
+    """
+    if len(requests) != len(targets):
+        raise ValueError("requests and targets must have the same length")
 
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        return list(ex.map(_retrieve, requests, targets))
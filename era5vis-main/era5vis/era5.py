@@ -1,13 +1,72 @@
 """Functions interacting with the ERA5 dataset. """
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
 import xarray as xr
 
 from era5vis import cfg
 
 
+def open_dataset(pathfile, mask_and_scale=False):
+    """Open an ERA5 NetCDF file or Zarr store lazily.
+
+    Zarr stores (written by era5vis.to_zarr) and NetCDF files (with the
+    default cfg.era5_chunks) keep their on-disk chunks, select the time
+    step and level before loading.
+    By default masking and scaling is skipped for all variables, use
+    decode_variable on the variables that are actually needed.
+
+    Parameters
+    ----------
+    pathfile : str or pathlib.Path
+        path to a '.nc' file or a '.zarr' store
+    mask_and_scale : bool
+        decode all variables on access instead
+
+    Returns
+    -------
+    ds : xarray.Dataset
+        dask-backed Dataset
+    """
+
+    if Path(pathfile).suffix == '.zarr':
+        return xr.open_zarr(pathfile, consolidated=True, chunks={},
+                            mask_and_scale=mask_and_scale)
+    return xr.open_dataset(pathfile, chunks=cfg.era5_chunks, engine='h5netcdf',
+                           mask_and_scale=mask_and_scale)
+
+
+def decode_variable(da):
+    """Apply CF masking and scaling to a variable from open_dataset.
+
+    Parameters
+    ----------
+    da : xarray.DataArray
+        variable with _FillValue, scale_factor and add_offset in its attrs
+
+    Returns
+    -------
+    da : xarray.DataArray
+        masked and scaled variable without the encoding attributes
+    """
+
+    attrs = dict(da.attrs)
+    fill = attrs.pop('_FillValue', None)
+    scale = attrs.pop('scale_factor', 1)
+    offset = attrs.pop('add_offset', 0)
+
+    out = da.copy(deep=False)
+    if fill is not None and not np.isnan(fill):
+        out = out.where(out != fill)
+    if scale != 1 or offset != 0:
+        out = out * scale + offset
+    out.attrs = attrs
+    return out
+
+
 def check_data_availability(param, level=None, time=None, time_ind=None):
     """function code to check if variable, model level, and time stamp are 
     in the data file and if not raise an exception."""
@@ -16,7 +75,7 @@ def check_data_availability(param, level=None, time=None, time_ind=None):
         print("The specified data file does not exist. Please set a valid path in cfg.py.")
         sys.exit()
 
-    with xr.open_dataset(cfg.datafile) as ds:
+    with open_dataset(cfg.datafile) as ds:
         # Check if parameter exists in dataset
         if param not in ds.variables:
             raise ValueError(f"Parameter '{param}' not found in dataset. "
@@ -70,12 +129,60 @@ def horiz_cross_section(param, lvl, time):
         sys.exit()
 
     # use either sel or sel depending on the type of time (index or date format)
-    with xr.open_dataset(cfg.datafile).load() as ds:
+    # the file is opened lazily, only the selected 2D slice is decoded and loaded
+    with open_dataset(cfg.datafile, mask_and_scale=True) as ds:
         if isinstance(time, str):
             da = ds[param].sel(pressure_level=lvl).sel(valid_time=time)
         elif isinstance(time, int):
             da = ds[param].sel(pressure_level=lvl).isel(valid_time=time)
         else:
             raise TypeError('time must be a time format string or integer')
+        # float32 is enough for plotting and halves the memory of decoded fields
+        da = da.load().astype(np.float32, copy=False)
 
     return da
+
+
+def _to_xyz(lat, lon):
+    """Unit-sphere cartesian coordinates of lat/lon in degrees, shape (n, 3)."""
+    lat, lon = np.deg2rad(lat), np.deg2rad(lon)
+    return np.column_stack((np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)))
+
+
+@lru_cache(maxsize=4)
+def _grid_tree(lats, lons):
+    """KD-tree of all grid points of a lat/lon grid, built once per grid."""
+    # scipy comes with metpy, only needed for point extraction
+    from scipy.spatial import cKDTree
+
+    lat2d, lon2d = np.meshgrid(lats, lons, indexing='ij')
+    return cKDTree(_to_xyz(lat2d.ravel(), lon2d.ravel()))
+
+
+def extract_points(da, lats, lons):
+    """Extract the values at the grid points nearest to a set of stations.
+
+    The nearest grid point is found on the sphere (the chord distance used
+    by the tree orders points the same as the great circle distance), with
+    a tree that is built only once per grid.
+
+    Parameters
+    ----------
+    da : xarray.DataArray
+        field with 'latitude' and 'longitude' dimensions
+    lats, lons : array_like
+        station coordinates in degrees
+
+    Returns
+    -------
+    da : xarray.DataArray
+        values at the stations along a new 'points' dimension
+    """
+
+    lat, lon = da['latitude'].values, da['longitude'].values
+    tree = _grid_tree(tuple(lat), tuple(lon))
+    _, idx = tree.query(_to_xyz(np.atleast_1d(lats), np.atleast_1d(lons)), k=1)
+    ilat, ilon = np.unravel_index(idx, (lat.size, lon.size))
+
+    return da.isel(latitude=xr.DataArray(ilat, dims='points'),
+                   longitude=xr.DataArray(ilon, dims='points'))
@@ -5,7 +5,7 @@ from datetime import datetime
 import matplotlib.pyplot as plt
 
 
-def plot_horiz_cross_section(da, filepath=None):
+def plot_horiz_cross_section(da, filepath=None, dpi=None, fig=None):
     ''' plot horizontal cross-section
 
     Parameters
@@ -14,10 +14,25 @@ def plot_horiz_cross_section(da, filepath=None):
         horizontal cross section
     filepath : str
         plot is saved to filepath if provided
+    dpi : float
+        resolution of the saved plot, matplotlib's savefig.dpi if None
+    fig : matplotlib.figure.Figure
+        existing figure to clear and draw into, a new one is created if None
+
+    Returns
+    -------
+    fig : matplotlib.figure.Figure
+        the figure, its first axes hold the map with labels and title
     '''
 
-    # set up a single set of axes
-    fig, ax = plt.subplots(figsize=(7, 5))
+    # set up a single set of axes, reusing the figure if one is given
+    own_fig = fig is None
+    if own_fig:
+        fig, ax = plt.subplots(figsize=(7, 5))
+    else:
+        fig.clear()
+        fig.set_size_inches(7, 5)
+        ax = fig.add_subplot()
     ax.set_position([0.1, 0.1, 0.7, 0.85])
     ax.set_xlabel(r'Longitude ($^{\circ}$)')
     ax.set_ylabel(r'Latitude ($^{\circ}$)')
@@ -26,14 +41,17 @@ def plot_horiz_cross_section(da, filepath=None):
                  + f'{da.pressure_level.units} ({time:%d %b %Y %H:%M})', fontsize=12
                 )
 
-    cf = ax.contourf(da, levels=20)
+    # rasterize the filled contours so that vector outputs (pdf, svg) stay
+    # small and fast to write, labels and ticks are kept as vectors
+    cf = ax.contourf(da, levels=20, rasterized=True)
     # add colorbar in separate axes
     cax = fig.add_axes([0.83, 0.1, 0.02, 0.85])
-    plt.colorbar(cf, cax=cax)
+    fig.colorbar(cf, cax=cax)
     cax.set_ylabel(f'({da.units})')
 
     if filepath is not None:
-        fig.savefig(filepath)
-        plt.close()
+        fig.savefig(filepath, dpi=dpi)
+        if own_fig:
+            plt.close(fig)
 
     return fig
@@ -1,6 +1,17 @@
 import xarray as xr
 import numpy as np
 
+def _speed_dir(u, v):
+    """Wind speed and direction (from) of numpy arrays, with in-place ops."""
+    wspd = np.hypot(u, v)  # sqrt(u**2 + v**2)
+    # atan2(-u, -v) is atan2(u, v) turned by 180 degrees
+    wdir = np.arctan2(u, v)
+    np.degrees(wdir, out=wdir)
+    np.add(wdir, 180.0, out=wdir)
+    np.mod(wdir, 360.0, out=wdir)
+    return wspd, wdir
+
+
 def add_wind_speed_dir(ds: xr.Dataset, u_name="u", v_name="v"):
 
     """
@@ -13,10 +24,9 @@ def add_wind_speed_dir(ds: xr.Dataset, u_name="u", v_name="v"):
     u = ds[u_name]
     v = ds[v_name]
 
-    wspd = np.hypot(u, v)  # sqrt(u**2 + v**2)
-
-    # meteorological direction wind is coming FROM
-    wdir = (np.degrees(np.arctan2(-u, -v)) + 360.0) % 360.0
+    # meteorological direction wind is coming FROM, both from one read of u and v
+    wspd, wdir = xr.apply_ufunc(_speed_dir, u, v, output_core_dims=[[], []],
+                                dask="parallelized", output_dtypes=[u.dtype, u.dtype])
 
     wspd = wspd.assign_attrs(
         long_name="Wind speed",
@@ -0,0 +1,59 @@
+"""Rewrite the model climatology with a chunk layout suited to monthly reads. """
+
+from pathlib import Path
+
+import xarray as xr
+
+from era5vis import cfg
+
+# dimensions stored with one entry per chunk, all others are kept whole
+SINGLE_DIMS = ('month', 'pressure_level')
+
+# source encoding kept in the copy, i.e. the on-disk dtype and packing
+KEEP_ENCODING = ('dtype', 'scale_factor', 'add_offset', '_FillValue', 'missing_value')
+
+
+def rechunk_clim(infile, outfile=None, complevel=1):
+    """Rewrite a monthly climatology as NETCDF4 with one chunk per month and level.
+
+    This does the same as
+    nccopy -k 4 -d 1 -c "month/1,pressure_level/1,latitude/NLAT,longitude/NLON"
+    so that selecting a single month reads a few chunks instead of striding
+    through a contiguous file. Like nccopy, the on-disk dtype and packing
+    (scale_factor, add_offset, _FillValue) of each variable are kept.
+
+    Parameters
+    ----------
+    infile : str or pathlib.Path
+        climatology file with a 'month' dimension
+    outfile : str or pathlib.Path
+        output file, defaults to infile with a '_chunked' suffix
+    complevel : int
+        deflate level of the compressed variables
+
+    Returns
+    -------
+    outfile : pathlib.Path
+        path to the rechunked file
+    """
+
+    infile = Path(infile)
+    if outfile is None:
+        outfile = infile.with_name(infile.stem + '_chunked' + infile.suffix)
+
+    with xr.open_dataset(infile) as ds:
+        encoding = {}
+        for var in ds.data_vars:
+            chunks = tuple(1 if dim in SINGLE_DIMS else ds.sizes[dim]
+                           for dim in ds[var].dims)
+            encoding[var] = {key: val for key, val in ds[var].encoding.items()
+                             if key in KEEP_ENCODING}
+            encoding[var].update({'zlib': True, 'complevel': complevel,
+                                  'contiguous': False, 'chunksizes': chunks})
+        ds.to_netcdf(outfile, format='NETCDF4', engine='netcdf4', encoding=encoding)
+
+    return Path(outfile)
+
+
+if __name__ == '__main__':
+    print(f'Rechunked climatology written to: {rechunk_clim(cfg.clim_file, cfg.clim_file_chunked)}')
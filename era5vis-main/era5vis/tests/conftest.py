@@ -2,34 +2,103 @@
 
 from datetime import datetime
 
+import dask
+import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import pytest
 import xarray as xr
 
-from era5vis import cfg
+from era5vis import cfg, era5, to_zarr
+
+# open the example file lazily with h5netcdf and its on-disk chunks, the
+# fixtures only need coordinates, so CF decoding is skipped and applied on
+# demand to the coordinates that need it
+OPEN_KWARGS = {'engine': 'h5netcdf', 'chunks': {}, 'decode_cf': False}
+
+# (file format, index of the parameter/level pair) the cross section tests
+# are run for: the shipped NetCDF file and a Zarr copy of it
+SECTION_PARAMS = [('netcdf', 0), ('netcdf', 1), ('zarr', 0)]
+
+
+def _param_level(ds, i):
+    # i-th variable on pressure levels together with the i-th level of ds
+    params = [variable for variable in ds.variables if
+              ('pressure_level' in ds[variable].dims) and ('longitude' in ds[variable].dims)]
+    levels = ds.pressure_level.to_numpy().astype(int)
+    return params[i % len(params)], levels[i % len(levels)]
+
+
+@pytest.fixture(scope='session', autouse=True)
+def synchronous_dask():
+
+    # the test data is small, computing in the calling thread avoids the
+    # overhead of the threaded scheduler and keeps runs deterministic
+    with dask.config.set(scheduler='synchronous'):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def close_figures():
+
+    # make sure no test leaves open figures behind
+    yield
+    plt.close('all')
 
-@pytest.fixture
-def retrieve_param_level_from_ds():
 
-    # retrieve variable name and level from the dataset to make sure 
+@pytest.fixture(scope='session')
+def shared_fig():
+
+    # a single figure reused by the graphics tests, it is not managed by
+    # pyplot so that closing all figures after each test leaves it alive
+    fig = Figure()
+    yield fig
+    fig.clear()
+
+
+@pytest.fixture(scope='session')
+def era5_example_ds():
+
+    # the example dataset is opened once and shared by the fixtures below
+    with xr.open_dataset(cfg.datafile, **OPEN_KWARGS) as ds:
+        yield ds
+
+
+@pytest.fixture(scope='session')
+def era5_zarr(tmp_path_factory):
+
+    # Zarr copy of the example dataset, written once per session
+    return to_zarr.to_zarr(cfg.datafile, tmp_path_factory.mktemp('zarr') / 'era5.zarr')
+
+
+@pytest.fixture(scope='session', params=SECTION_PARAMS, ids=lambda p: f'{p[0]}-{p[1]}')
+def retrieve_param_level_from_ds(request, era5_example_ds):
+
+    # retrieve variable name and level from the dataset to make sure
     # that we don't call the function with bad arguments
-    with xr.open_dataset(cfg.datafile) as ds:
-        param = [variable for variable in ds.variables if
-                 ('pressure_level' in ds[variable].dims) and ('longitude' in ds[variable].dims)][0]
-        level = ds.pressure_level.to_numpy()[0].astype(int)
+    fmt, i = request.param
+    param, level = _param_level(era5_example_ds, i)
+
+    # the cross section is read once per parameter and file format and
+    # shared by all tests, the Zarr copy is only written when needed
+    if fmt == 'zarr':
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(cfg, 'datafile', request.getfixturevalue('era5_zarr'))
+            da = era5.horiz_cross_section(param, level, 0)
+    else:
+        da = era5.horiz_cross_section(param, level, 0)
 
-    return param, level
+    return param, level, da
 
 
 @pytest.fixture
-def retrieve_param_level_time_from_ds():
+def retrieve_param_level_time_from_ds(era5_example_ds):
 
     # retrieve variable name, level, and time from the dataset to make sure 
     # that we don't call the function with bad arguments
-    with xr.open_dataset(cfg.datafile) as ds:
-        param = [variable for variable in ds.variables if
-                 ('pressure_level' in ds[variable].dims) and ('longitude' in ds[variable].dims)][0]
-        level = ds.pressure_level.to_numpy()[0].astype(int)
-        time = ds.valid_time.to_numpy()[0].astype(
-               'datetime64[ms]').astype(datetime).strftime('%Y%m%d%H%M')
+    ds = era5_example_ds
+    param, level = _param_level(ds, 0)
+    valid_time = xr.decode_cf(ds[['valid_time']]).valid_time
+    time = valid_time.to_numpy()[0].astype(
+           'datetime64[ms]').astype(datetime).strftime('%Y%m%d%H%M')
 
     return param, level, time
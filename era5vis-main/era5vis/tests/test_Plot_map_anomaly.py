@@ -0,0 +1,58 @@
+''' Test functions for Plot_map_anomaly.py '''
+
+import numpy as np
+import xarray as xr
+
+from era5vis import Plot_map_anomaly as pma
+
+
+def _field(lats, lons, offset=0.):
+    data = np.add.outer(lats, 10 * lons).astype('float32') + offset
+    return xr.DataArray(data, dims=('latitude', 'longitude'), name='t',
+                        coords={'latitude': lats, 'longitude': lons})
+
+
+def test_anomaly():
+
+    lats = np.arange(50., 40., -1.)
+    lons = np.arange(0., 8.)
+    var = _field(lats, lons, offset=5.)
+
+    # same grid: the arrays are subtracted directly and the grid is kept
+    clim = _field(lats, lons)
+    assert pma._same_grid(var, clim)
+    anom = pma._anomaly(var, clim)
+    assert anom.shape == var.shape
+    np.testing.assert_allclose(anom.values, 5.)
+    xr.testing.assert_equal(anom.longitude, var.longitude)
+
+    # climatology shifted by one column: xarray aligns the fields and only
+    # the overlapping columns are left, with matching points subtracted
+    clim = _field(lats, lons + 1.)
+    assert not pma._same_grid(var, clim)
+    anom = pma._anomaly(var, clim)
+    np.testing.assert_array_equal(anom.longitude, lons[1:])
+    np.testing.assert_allclose(anom.values, 5.)
+
+
+def test_coarsen():
+
+    # 10 x 7 grid, neither size is divisible by the factor 3
+    lats = np.arange(50., 40., -1.)
+    lons = np.arange(0., 7.)
+    da = _field(lats, lons)
+
+    # factor 1 leaves the field untouched
+    assert pma._coarsen(da, 1) is da
+
+    # incomplete blocks at the end are trimmed, the coordinates are the
+    # block means and each cell is the mean of its block
+    out = pma._coarsen(da, 3)
+    assert out.shape == (3, 2)
+    np.testing.assert_allclose(out.latitude, [49., 46., 43.])
+    np.testing.assert_allclose(out.longitude, [1., 4.])
+    np.testing.assert_allclose(out.values, da.values[:9, :6].reshape(3, 3, 2, 3).mean(axis=(1, 3)))
+
+    # on a divisible grid the mean of the field is kept
+    out = pma._coarsen(da.isel(latitude=slice(0, 9), longitude=slice(0, 6)), 3)
+    np.testing.assert_allclose(out.mean(), da.values[:9, :6].mean())
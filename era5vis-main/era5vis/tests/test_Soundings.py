@@ -0,0 +1,18 @@
+''' Test functions for Soundings.py '''
+
+import numpy as np
+import metpy.calc as mpcalc
+from metpy.units import units
+
+from era5vis import Soundings
+
+
+def test_td_from_q():
+
+    # pressure levels from the surface to the stratosphere and specific
+    # humidities from very dry to tropical boundary layer values
+    p, q = np.meshgrid(np.linspace(1000e2, 100e2, 19), np.geomspace(1e-6, 0.025, 25))
+
+    td = Soundings._td_from_q(p, q)
+    expected = mpcalc.dewpoint_from_specific_humidity(p * units.Pa, q * units('kg/kg'))
+    np.testing.assert_allclose(td, expected.m_as('K'), atol=0.05)
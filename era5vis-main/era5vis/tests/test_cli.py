@@ -58,3 +58,15 @@ def test_error(capsys):
     modellevel(['-p', 'z'])
     captured = capsys.readouterr()
     assert 'command not understood' in captured.out
+
+    # check that unknown options and bad values are not understood either
+    # (without argparse printing its own usage and error message)
+    modellevel(['-p', 'z', '-lvl', '500', '--unknown'])
+    captured = capsys.readouterr()
+    assert 'command not understood' in captured.out
+    assert captured.err == ''
+
+    modellevel(['-p', 'z', '-lvl', 'high'])
+    captured = capsys.readouterr()
+    assert 'command not understood' in captured.out
+    assert captured.err == ''
@@ -17,8 +17,10 @@ def test_write_html(retrieve_param_level_from_ds):
 
     # check that the html file is created and that the 
     # directory contains a png file
-    param, level = retrieve_param_level_from_ds
+    param, level, _ = retrieve_param_level_from_ds
     htmlfile = core.write_html(param, level=level, time_ind=0)
     assert Path.is_file(htmlfile)
     assert htmlfile.suffix == '.html'
-    assert list(htmlfile.parent.glob('*.png'))
+    pngs = list(htmlfile.parent.glob('*.png'))
+    assert pngs
+    assert pngs[0].read_bytes()[:8] == b'\x89PNG\r\n\x1a\n'
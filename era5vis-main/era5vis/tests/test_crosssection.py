@@ -1,5 +1,10 @@
 from pathlib import Path
 
+import numpy as np
+import xarray as xr
+
+from era5vis import crosssection
+
 
 def test_required_data_files_exist():
     """Check that required data files are present in the repository."""
@@ -13,4 +18,23 @@ def test_required_data_files_exist():
     ]
 
     for file in required_files:
-        assert file.exists(), f"Missing required file: {file}"
\ No newline at end of file
+        assert file.exists(), f"Missing required file: {file}"
+
+
+def test_bicubic_section():
+
+    lat = np.arange(90., 80., -0.25)
+    da = xr.DataArray(np.tile(3 * lat + 1, (2, 1)), dims=("pressure_level", "latitude"),
+                      coords={"pressure_level": [500., 850.], "latitude": lat})
+
+    # on a grid line the bicubic section is the nearest one
+    idx, weights = crosssection.section_indexer(da.latitude, 85.0, "bicubic")
+    np.testing.assert_allclose(weights, [0, 1, 0, 0], atol=1e-12)
+    np.testing.assert_allclose(crosssection.cut_section(da, "latitude", (idx, weights)),
+                               da.sel(latitude=85.0))
+
+    # between grid lines a linear field is reproduced exactly
+    indexer = crosssection.section_indexer(da.latitude, 84.9, "bicubic")
+    np.testing.assert_allclose(crosssection.cut_section(da, "latitude", indexer), 3 * 84.9 + 1)
+
+    assert crosssection.section_indexer(da.latitude, 84.9) == 20
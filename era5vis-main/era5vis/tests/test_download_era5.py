@@ -0,0 +1,69 @@
+''' Test functions for download_era5.py '''
+
+import pytest
+
+from era5vis import download_era5
+from era5vis.download_era5 import parse_month
+
+
+def test_parse_month():
+
+    assert parse_month('3') == '03'
+    assert parse_month('03') == '03'
+    assert parse_month(' 12 ') == '12'
+    assert parse_month('January') == '01'
+    assert parse_month('MÄRZ') == '03'
+    assert parse_month('sep') == '09'
+
+    for bad in ('0', '13', 'foo', ''):
+        with pytest.raises(ValueError, match='Could not parse month'):
+            parse_month(bad)
+
+
+def test_download_era5_single_request(tmp_path, monkeypatch):
+
+    # record the requests instead of contacting the CDS
+    calls = []
+
+    class FakeClient:
+        def retrieve(self, dataset, request, target):
+            calls.append((dataset, request, target))
+
+    monkeypatch.setattr(download_era5.cdsapi, 'Client', FakeClient)
+
+    target = download_era5.download_era5(['2023', '2024'], ['01', '02'], tmp_path / 'era5.nc')
+    assert target == tmp_path / 'era5.nc'
+    assert len(calls) == 1
+    assert calls[0][1]['year'] == ['2023', '2024']
+    assert calls[0][1]['month'] == ['01', '02']
+
+    # single values still work
+    download_era5.download_era5('2024', '03', tmp_path / 'era5.nc')
+    assert calls[1][1]['year'] == ['2024']
+    assert calls[1][1]['month'] == ['03']
+
+
+def test_download_many(tmp_path, monkeypatch):
+
+    # each thread gets its own client, record the requests instead of downloading
+    clients = []
+
+    class FakeClient:
+        def __init__(self):
+            self.calls = []
+            clients.append(self)
+
+        def retrieve(self, dataset, request, target):
+            self.calls.append((request['month'], target))
+
+    monkeypatch.setattr(download_era5.cdsapi, 'Client', FakeClient)
+
+    requests = [download_era5.build_request('2024', m) for m in ('01', '02', '03')]
+    targets = [tmp_path / f'era5_{m}.nc' for m in ('01', '02', '03')]
+    assert download_era5.download_many(requests, targets, max_workers=2) == targets
+    assert len(clients) == 3
+    assert sorted(c.calls[0] for c in clients) == [(['01'], targets[0]), (['02'], targets[1]),
+                                                   (['03'], targets[2])]
+
+    with pytest.raises(ValueError):
+        download_era5.download_many(requests, targets[:1])
@@ -8,9 +8,8 @@ from era5vis import era5
 
 def test_horiz_cross_section(retrieve_param_level_from_ds):
 
-    # extract the horizontal cross section
-    param, level = retrieve_param_level_from_ds
-    da = era5.horiz_cross_section(param, level, 0)
+    # horizontal cross section extracted by the fixture
+    param, level, da = retrieve_param_level_from_ds
 
     # check that the correct parameter is extracted
     assert da.GRIB_shortName == param
@@ -20,5 +19,39 @@ def test_horiz_cross_section(retrieve_param_level_from_ds):
     assert da.dims == ('latitude', 'longitude')
 
     # check that pressure_level and valid_time are indeed scalars
-    da.pressure_level.item()
-    da.valid_time.item()
+    # (the section is loaded, so .values does not trigger any computation)
+    assert da.pressure_level.values.ndim == 0
+    assert da.valid_time.values.ndim == 0
+
+
+def test_decode_variable(tmp_path):
+
+    # write a variable packed as int16 with scale_factor, add_offset and _FillValue
+    t = xr.DataArray(np.array([[250., 260.], [270., np.nan]]), dims=('latitude', 'longitude'),
+                     attrs={'units': 'K'}, name='t')
+    path = tmp_path / 'packed.nc'
+    t.to_dataset().to_netcdf(path, encoding={'t': {'dtype': 'int16', 'scale_factor': 0.01,
+                                                   'add_offset': 260., '_FillValue': -32767}})
+
+    # check that the raw variable is still packed and decoding restores it
+    ds = era5.open_dataset(path)
+    assert ds.t.dtype == np.int16
+    da = era5.decode_variable(ds.t).load()
+    np.testing.assert_allclose(da.values, t.values, atol=0.01)
+    assert da.attrs == {'units': 'K'}
+
+
+def test_extract_points():
+
+    lat = np.arange(90., 34.75, -0.25)
+    lon = np.arange(-55., 45.25, 0.25)
+    da = xr.DataArray(np.add.outer(lat, 1000 * lon), dims=('latitude', 'longitude'),
+                      coords={'latitude': lat, 'longitude': lon})
+
+    # stations between grid points get the values of the nearest grid point
+    lats, lons = [47.26, 62.5, 80.1], [11.39, -10.0, 44.9]
+    out = era5.extract_points(da, lats, lons)
+    assert out.dims == ('points',)
+    expected = [da.sel(latitude=la, longitude=lo, method='nearest').item()
+                for la, lo in zip(lats, lons)]
+    np.testing.assert_allclose(out.values, expected)
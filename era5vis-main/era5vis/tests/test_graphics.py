@@ -2,45 +2,54 @@
 
 from pathlib import Path
 
-import numpy as np
-import matplotlib as mpl
-import matplotlib.pyplot as plt
+import matplotlib
 
-from era5vis import era5, graphics
+# draw with the non-interactive backend, no display is needed for the tests
+matplotlib.use('Agg')
 
+from matplotlib.figure import Figure
 
-def test_plot_horiz_cross_section_graphic(retrieve_param_level_from_ds):
+from era5vis import graphics
 
-    # create test dataset
-    param, level = retrieve_param_level_from_ds
-    da = era5.horiz_cross_section(param, level, 0)
 
-    # call function to create figure object
-    fig = graphics.plot_horiz_cross_section(da)
-
-    # check that xlabel and ylabel text are found in figure and
-    # the parameter name
-    test = ['Longitude' in t.get_text() for t in fig.findobj(mpl.text.Text)]
-    assert np.any(test)
-
-    test = ['Latitude' in t.get_text() for t in fig.findobj(mpl.text.Text)]
-    assert np.any(test)
-
-    test = [da.long_name in t.get_text() for t in fig.findobj(mpl.text.Text)]
-    assert np.any(test)
-
-    plt.close('all')
+def test_plot_horiz_cross_section(tmp_path, shared_fig, retrieve_param_level_from_ds):
 
+    # test dataset from the fixture
+    _, _, da = retrieve_param_level_from_ds
 
-def test_plot_horiz_cross_section_saving(tmpdir, retrieve_param_level_from_ds):
-
-    # create test dataset
-    param, level = retrieve_param_level_from_ds
-    da = era5.horiz_cross_section(param, level, 0)
-
-    # check that figure file is saved
-    fpath = Path(tmpdir.join('timeseries.png'))
-    graphics.plot_horiz_cross_section(da, filepath=fpath)
-    assert Path.is_file(fpath)
-
-    plt.close('all')
+    # call function to create figure object
+    fig = graphics.plot_horiz_cross_section(da, fig=shared_fig)
+    assert isinstance(fig, Figure)
+
+    # check that xlabel and ylabel text and the parameter name are
+    # found on the main axes
+    ax = fig.axes[0]
+    assert 'Longitude' in ax.get_xlabel()
+    assert 'Latitude' in ax.get_ylabel()
+    assert da.long_name in ax.get_title()
+
+    # check that the same figure is saved as raster and vector file
+    for fname in ['timeseries.png', 'timeseries.pdf']:
+        fpath = tmp_path / fname
+        fig.savefig(fpath, dpi=72)
+        assert fpath.is_file()
+
+
+def test_plot_horiz_cross_section_saving(monkeypatch, tmp_path, shared_fig,
+                                         retrieve_param_level_from_ds):
+
+    # test dataset from the fixture
+    _, _, da = retrieve_param_level_from_ds
+
+    # the rendered output is checked above, here only check that the figure
+    # is saved to filepath, so savefig just creates the file
+    saved = []
+    def fake_savefig(self, fname, **kwargs):
+        saved.append((fname, kwargs))
+        Path(fname).touch()
+    monkeypatch.setattr(Figure, 'savefig', fake_savefig)
+
+    fpath = tmp_path / 'timeseries.png'
+    graphics.plot_horiz_cross_section(da, filepath=fpath, dpi=72, fig=shared_fig)
+    assert fpath.is_file()
+    assert saved == [(fpath, {'dpi': 72})]
@@ -0,0 +1,26 @@
+''' Test functions for helpers.py '''
+
+import numpy as np
+import xarray as xr
+
+from era5vis import helpers
+
+
+def test_add_wind_speed_dir():
+
+    # winds from north, east, south, west and calm
+    u = np.array([0., -5., 0., 5., 0.])
+    v = np.array([-3., 0., 4., 0., 0.])
+    ds = xr.Dataset({'u': ('x', u), 'v': ('x', v)})
+
+    out = helpers.add_wind_speed_dir(ds)
+    np.testing.assert_allclose(out.wspd, [3., 5., 4., 5., 0.])
+    np.testing.assert_allclose(out.wdir, [0., 90., 180., 270., 180.])
+    np.testing.assert_allclose(out.wdir, (np.degrees(np.arctan2(-u, -v)) + 360.0) % 360.0)
+    assert out.wspd.dims == ('x',)
+    assert out.wdir.attrs['units'] == 'degrees'
+
+    # dask-backed input stays lazy
+    lazy = helpers.add_wind_speed_dir(ds.chunk({'x': 2}))
+    assert lazy.wspd.chunks is not None
+    np.testing.assert_allclose(lazy.wdir.values, out.wdir.values)
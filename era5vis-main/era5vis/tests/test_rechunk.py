@@ -0,0 +1,38 @@
+''' Test functions for rechunk.py '''
+
+import numpy as np
+import xarray as xr
+
+from era5vis import rechunk
+
+
+def test_rechunk_clim(tmp_path):
+
+    # create a small contiguous climatology file
+    infile = tmp_path / 'clim.nc'
+    ds = xr.Dataset({'t': (('month', 'pressure_level', 'latitude', 'longitude'),
+                           np.random.rand(12, 3, 4, 5).astype('float32'))},
+                    coords={'month': np.arange(1, 13), 'pressure_level': [850., 700., 500.],
+                            'latitude': np.arange(4.), 'longitude': np.arange(5.)})
+    ds['z'] = ds.t * 1000.
+    ds.to_netcdf(infile, encoding={'z': {'dtype': 'int16', 'scale_factor': 0.5,
+                                         'add_offset': 500., '_FillValue': -32767}})
+
+    # check that the chunked copy is written next to the input
+    outfile = rechunk.rechunk_clim(infile)
+    assert outfile == tmp_path / 'clim_chunked.nc'
+
+    # check that each month and level is a separate chunk and data is unchanged
+    with xr.open_dataset(outfile) as out:
+        assert out.t.encoding['chunksizes'] == (1, 1, 4, 5)
+        xr.testing.assert_equal(out.t, ds.t)
+
+    # check that dtype and packing of the input are kept
+    with xr.open_dataset(infile, mask_and_scale=False) as raw_in, \
+         xr.open_dataset(outfile, mask_and_scale=False) as raw_out:
+        for var in ('t', 'z'):
+            assert raw_out[var].dtype == raw_in[var].dtype
+            for key in ('scale_factor', 'add_offset', '_FillValue'):
+                np.testing.assert_equal(raw_out[var].attrs.get(key), raw_in[var].attrs.get(key))
+        assert raw_out.z.dtype == 'int16'
+        xr.testing.assert_equal(raw_out.z, raw_in.z)
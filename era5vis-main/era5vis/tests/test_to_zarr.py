@@ -0,0 +1,28 @@
+''' Test functions for to_zarr.py '''
+
+import numpy as np
+import xarray as xr
+
+from era5vis import era5, to_zarr
+
+
+def test_to_zarr(tmp_path):
+
+    # create a small ERA5-like file
+    ncfile = tmp_path / 'era5.nc'
+    ds = xr.Dataset({'t': (('valid_time', 'pressure_level', 'latitude', 'longitude'),
+                           np.random.rand(2, 3, 70, 80).astype('float32'))},
+                    coords={'valid_time': np.array(['2025-10-01', '2025-10-02'],
+                                                   dtype='datetime64[ns]'),
+                            'pressure_level': [850., 700., 500.],
+                            'latitude': np.arange(70.), 'longitude': np.arange(80.)})
+    ds.to_netcdf(ncfile)
+
+    # check that the store is written next to the input
+    zarrfile = to_zarr.to_zarr(ncfile)
+    assert zarrfile == tmp_path / 'era5.zarr'
+
+    # check that era5.open_dataset keeps the Zarr chunks and data is unchanged
+    out = era5.open_dataset(zarrfile)
+    assert out.t.chunks == ((1, 1), (3,), (64, 6), (64, 16))
+    xr.testing.assert_equal(out.t.load(), ds.t)
@@ -0,0 +1,45 @@
+"""Mirror ERA5 NetCDF files to Zarr stores chunked for column and slab reads. """
+
+import sys
+from pathlib import Path
+
+import xarray as xr
+
+# one time step (or month) per chunk with all levels and 64x64 horizontal
+# tiles, so a sounding column or a single-level map only touches few chunks
+ZARR_CHUNKS = {'valid_time': 1, 'month': 1, 'pressure_level': -1,
+               'latitude': 64, 'longitude': 64}
+
+
+def to_zarr(ncfile, zarrfile=None):
+    """Write a copy of a NetCDF file as a chunked, consolidated Zarr store.
+
+    Parameters
+    ----------
+    ncfile : str or pathlib.Path
+        ERA5, climatology or terrain NetCDF file
+    zarrfile : str or pathlib.Path
+        output store, defaults to ncfile with a '.zarr' suffix
+
+    Returns
+    -------
+    zarrfile : pathlib.Path
+        path to the Zarr store
+    """
+
+    ncfile = Path(ncfile)
+    if zarrfile is None:
+        zarrfile = ncfile.with_suffix('.zarr')
+
+    with xr.open_dataset(ncfile) as ds:
+        chunks = {dim: size for dim, size in ZARR_CHUNKS.items() if dim in ds.dims}
+        # Zarr format 2: consolidated metadata and string coordinates such
+        # as 'expver' are part of its specification (not yet of format 3)
+        ds.chunk(chunks).to_zarr(zarrfile, mode='w', consolidated=True, zarr_format=2)
+
+    return Path(zarrfile)
+
+
+if __name__ == '__main__':
+    for ncfile in sys.argv[1:]:
+        print(f'Zarr store written to: {to_zarr(ncfile)}')
@@ -53,6 +53,9 @@ req_packages = ['numpy',
                 'xarray',
                 'matplotlib',
                 'netCDF4',
+                'h5netcdf',
+                'h5py',
+                'dask',
                 'cdsapi'
                 ]
 
@@ -184,7 +187,7 @@ setup(
 
     # If there are data files included in your packages that need to be
     # installed, specify them here.
-    package_data={'era5vis': ['data/template.html'],
+    package_data={'era5vis': ['data/template.html', 'data/*.nc'],
     },
 
     # Although 'package_data' is the preferred approach, in some case you may